@@ -194,11 +194,23 @@ def filter_data(state: AgentExecutorState) -> AgentExecutorState:
             "Can not filter by min_discount_percentage when discount is False."
         )
 
+    # Lowercase the allow-lists once instead of once per order.
+    product_names_lower = (
+        frozenset(name.lower() for name in product_names) if product_names else None
+    )
+    order_state_lower = (
+        frozenset(s.lower() for s in order_state) if order_state else None
+    )
+    status_lower = frozenset(s.lower() for s in status) if status else None
+
     filtered_orders = []
     for order in orders:
         is_match = True
 
-        if product_names and order.get("productName", "").lower() not in product_names:
+        if (
+            product_names_lower
+            and order.get("productName", "").lower() not in product_names_lower
+        ):
             is_match = False
         if before_date and order.get("orderedAt", "") > before_date:
             is_match = False
@@ -208,9 +220,11 @@ def filter_data(state: AgentExecutorState) -> AgentExecutorState:
             is_match = False
         if max_amount is not None and order.get("amount", 0) > max_amount:
             is_match = False
-        if order_state:
-            order_state_lower = order.get("address", {}).get("state", "").lower()
-            if not any(state.lower() == order_state_lower for state in order_state):
+        if order_state_lower:
+            if (
+                order.get("address", {}).get("state", "").lower()
+                not in order_state_lower
+            ):
                 is_match = False
         if discount is not None:
             order_has_discount = "discount" in order and order["discount"] is not None
@@ -220,9 +234,8 @@ def filter_data(state: AgentExecutorState) -> AgentExecutorState:
             order_discount = order.get("discount")
             if order_discount is None or order_discount < min_discount_percentage:
                 is_match = False
-        if status:
-            order_status_lower = order.get("status", "").lower()
-            if not any(s.lower() == order_status_lower for s in status):
+        if status_lower:
+            if order.get("status", "").lower() not in status_lower:
                 is_match = False
 
         if is_match:
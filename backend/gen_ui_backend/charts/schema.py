@@ -1,9 +1,19 @@
-from typing import List, Literal, Optional, Type
+from functools import lru_cache
+from typing import List, Literal, Optional, Tuple, Type, TypedDict
 
 from langchain_core.pydantic_v1 import BaseModel, Field
 
 ChartType = Literal["bar", "line", "pie"]
 
+ORDER_STATUSES = (
+    "pending",
+    "processing",
+    "shipped",
+    "delivered",
+    "cancelled",
+    "returned",
+)
+
 
 class Address(BaseModel):
     street: str = Field(..., description="The address street.", example="123 Main St")
@@ -32,7 +42,7 @@ class Order(BaseModel):
     status: str = Field(
         ...,
         description="The current status of the order.",
-        enum=["pending", "processing", "shipped", "delivered", "cancelled", "returned"],
+        enum=list(ORDER_STATUSES),
     )
     orderedAt: str = Field(
         ..., description="The date the order was placed. Must be a valid date string."
@@ -62,12 +72,18 @@ class Filter(BaseModel):
     status: Optional[str] = Field(
         None,
         description="Order status to filter by",
-        enum=["pending", "processing", "shipped", "delivered", "cancelled", "returned"],
+        enum=list(ORDER_STATUSES),
     )
 
 
 def filter_schema(product_names: List[str]) -> Type[BaseModel]:
-    product_names_as_string = ", ".join(name.lower() for name in product_names)
+    return _build_filter_schema(tuple(sorted({name.lower() for name in product_names})))
+
+
+@lru_cache(maxsize=128)
+def _build_filter_schema(product_names: Tuple[str, ...]) -> Type[BaseModel]:
+    """Build the FilterSchema class once per unique set of product names."""
+    product_names_as_string = ", ".join(product_names)
 
     class FilterSchema(BaseModel):
         """Available filters to apply to orders."""
@@ -107,28 +123,18 @@ def filter_schema(product_names: List[str]) -> Type[BaseModel]:
         status: Optional[List[str]] = Field(
             None,
             description="The current status(es) of the order to filter by. This field should only be populated if a user mentions a specific status. If a specific status was not mentioned, do NOT populate this field. If populated, this field should ALWAYS be a list.",
-            enum=[
-                "pending",
-                "processing",
-                "shipped",
-                "delivered",
-                "cancelled",
-                "returned",
-            ],
+            enum=list(ORDER_STATUSES),
         )
 
     return FilterSchema
 
 
-class DataDisplayTypeAndDescription(BaseModel):
-    title: str = Field(..., description="The title of the data display type.")
-    chartType: ChartType = Field(
-        ..., description="The type of chart which this format can be displayed on."
-    )
-    description: str = Field(
-        ..., description="The description of the data display type."
-    )
-    key: str = Field(..., description="The key of the data display type.")
-
-    class Config:
-        allow_population_by_field_name = True
+class DataDisplayTypeAndDescription(TypedDict):
+    title: str
+    """The title of the data display type."""
+    chartType: ChartType
+    """The type of chart which this format can be displayed on."""
+    description: str
+    """The description of the data display type."""
+    key: str
+    """The key of the data display type."""
@@ -1,17 +1,26 @@
-import uvicorn
+import os
+import sys
+from typing import TYPE_CHECKING
+
 from dotenv import load_dotenv
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from langserve import add_routes
 
-from gen_ui_backend.chain import create_graph
-from gen_ui_backend.types import ChatInputType
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 # Load environment variables from .env file
 load_dotenv()
 
 
-def start() -> None:
+def create_app() -> "FastAPI":
+    # Imported here so importing this module doesn't pull in the web stack
+    # and build the graph's pydantic models until the app is created.
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+    from langserve import add_routes
+
+    from gen_ui_backend.chain import create_graph
+    from gen_ui_backend.types import ChatInputType
+
     app = FastAPI(
         title="Gen UI Backend",
         version="1.0",
@@ -37,5 +46,27 @@ def start() -> None:
     runnable = graph.with_types(input_type=ChatInputType, output_type=dict)
 
     add_routes(app, runnable, path="/chat", playground_type="chat")
+    return app
+
+
+def start() -> None:
+    import uvicorn
+
+    # Run a few worker processes, except on Windows where uvicorn's
+    # multiprocess supervisor is unreliable. Set WEB_CONCURRENCY (the same
+    # variable the uvicorn CLI reads) to override, e.g. 1 for local debugging.
+    default_workers = 1 if sys.platform == "win32" else min(os.cpu_count() or 1, 4)
+    workers = int(os.environ.get("WEB_CONCURRENCY") or default_workers)
+
     print("Starting server...")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Pass the factory as an import string so uvicorn builds the app itself,
+    # which is required when running more than one worker.
+    uvicorn.run(
+        "gen_ui_backend.server:create_app",
+        factory=True,
+        host="0.0.0.0",
+        port=8000,
+        workers=workers,
+        # Keep idle frontend connections open between chat turns (default 5s).
+        timeout_keep_alive=75,
+    )
@@ -7,7 +7,8 @@ from langchain_core.tools import tool
 
 class LineItem(BaseModel):
     id: str = Field(
-        default_factory=uuid4, description="Unique identifier for the line item"
+        default_factory=lambda: uuid4().hex,
+        description="Unique identifier for the line item",
     )
     name: str = Field(..., description="Name or description of the line item")
     quantity: int = Field(..., gt=0, description="Quantity of the line item")
@@ -62,7 +63,9 @@ def invoice_parser(
     paymentInfo: Optional[PaymentInfo],
 ) -> Invoice:
     """Parse an invoice and return it without modification."""
-    return Invoice(
+    # The arguments were already validated against `args_schema`, so skip
+    # re-validating (and copying) every nested model.
+    return Invoice.construct(
         orderId=orderId,
         lineItems=lineItems,
         shippingAddress=shippingAddress,